@@ -1,4 +1,5 @@
 from __future__ import annotations
+import math
 import numbers
 import pathlib
 import sys
@@ -771,6 +772,98 @@ class Bits:
         return e4m3mxfp_fmt.lut_int_to_float[byte_data[0]]
         pass
 
+    def _sete5m2mxfp(self, value: float, length: Optional[int]=None) -> None:
+        """Reset the bitstring to have given e5m2mxfp float interpretation."""
+        if length is not None and length != 8:
+            raise ValueError("e5m2mxfp must be 8 bits.")
+        # Convert to bytes using the e5m2mxfp format
+        byte_data = e5m2mxfp_saturate_fmt.float_to_int(value).to_bytes(1, byteorder='big', signed=False)
+        self._setbytes(byte_data)
+
+    def _gete5m2mxfp(self) -> float:
+        """Return data as an e5m2mxfp float."""
+        if len(self) != 8:
+            raise bitstring.InterpretError("e5m2mxfp requires 8 bits.")
+        # Convert from bytes using the e5m2mxfp format
+        byte_data = self._getbytes()
+        return e5m2mxfp_saturate_fmt.lut_int_to_float[byte_data[0]]
+
+    def _sete3m2mxfp(self, value: float, length: Optional[int]=None) -> None:
+        """Reset the bitstring to have given e3m2mxfp float interpretation."""
+        if length is not None and length != 6:
+            raise ValueError("e3m2mxfp must be 6 bits.")
+        self._setuint(e3m2mxfp_fmt.float_to_int(value), 6)
+
+    def _gete3m2mxfp(self) -> float:
+        """Return data as an e3m2mxfp float."""
+        if len(self) != 6:
+            raise bitstring.InterpretError("e3m2mxfp requires 6 bits.")
+        return e3m2mxfp_fmt.lut_int_to_float[self._getuint()]
+
+    def _sete2m3mxfp(self, value: float, length: Optional[int]=None) -> None:
+        """Reset the bitstring to have given e2m3mxfp float interpretation."""
+        if length is not None and length != 6:
+            raise ValueError("e2m3mxfp must be 6 bits.")
+        self._setuint(e2m3mxfp_fmt.float_to_int(value), 6)
+
+    def _gete2m3mxfp(self) -> float:
+        """Return data as an e2m3mxfp float."""
+        if len(self) != 6:
+            raise bitstring.InterpretError("e2m3mxfp requires 6 bits.")
+        return e2m3mxfp_fmt.lut_int_to_float[self._getuint()]
+
+    def _sete2m1mxfp(self, value: float, length: Optional[int]=None) -> None:
+        """Reset the bitstring to have given e2m1mxfp float interpretation."""
+        if length is not None and length != 4:
+            raise ValueError("e2m1mxfp must be 4 bits.")
+        self._setuint(e2m1mxfp_fmt.float_to_int(value), 4)
+
+    def _gete2m1mxfp(self) -> float:
+        """Return data as an e2m1mxfp float."""
+        if len(self) != 4:
+            raise bitstring.InterpretError("e2m1mxfp requires 4 bits.")
+        return e2m1mxfp_fmt.lut_int_to_float[self._getuint()]
+
+    def _sete8m0mxfp(self, value: float, length: Optional[int]=None) -> None:
+        """Reset the bitstring to have given e8m0mxfp float interpretation."""
+        if length is not None and length != 8:
+            raise ValueError("e8m0mxfp must be 8 bits.")
+        if math.isnan(value):
+            self._setbytes(b'\xff')
+            return
+        # No rounding is done for this format, so non-representable values raise.
+        byte_data = bitstore_helpers.e8m0_index(value).to_bytes(1, byteorder='big', signed=False)
+        self._setbytes(byte_data)
+
+    def _gete8m0mxfp(self) -> float:
+        """Return data as an e8m0mxfp float."""
+        if len(self) != 8:
+            raise bitstring.InterpretError("e8m0mxfp requires 8 bits.")
+        byte_data = self._getbytes()
+        if byte_data[0] == 0xff:
+            return float('nan')
+        return bitstore_helpers.e8m0mxfp_allowed_values[byte_data[0]]
+
+    def _setmxint(self, value: float, length: Optional[int]=None) -> None:
+        """Reset the bitstring to have given mxint float interpretation."""
+        if length is not None and length != 8:
+            raise ValueError("mxint must be 8 bits.")
+        if math.isnan(value):
+            raise ValueError("Cannot convert float('nan') to mxint format.")
+        # mxint is a two's complement int8 with an implicit scale of 2^-6.
+        i = round(value * 64)
+        if i > 127:
+            i = 127
+        elif i < -128:
+            i = -128
+        self._setint(i, 8)
+
+    def _getmxint(self) -> float:
+        """Return data as an mxint float."""
+        if len(self) != 8:
+            raise bitstring.InterpretError("mxint requires 8 bits.")
+        return self._getint() * 2 ** -6
+
     def _getuint(self) -> int:
         """Return data as an unsigned int."""
         pass
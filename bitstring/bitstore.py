@@ -3,6 +3,15 @@ import bitarray
 from bitstring.exceptions import CreationError
 from typing import Union, Iterable, Optional, overload, Iterator, Any
 
+def offset_slice_indices_lsb0(key: slice, length: int) -> slice:
+    """Convert slice indices from LSB0 to MSB0 ordering."""
+    # First convert slice to all integers.
+    # Length already should take account of the offset.
+    start, stop, step = key.indices(length)
+    new_start = length - stop
+    new_stop = length - start
+    return slice(new_start, new_stop, step)
+
 class BitStore:
     """A light wrapper around bitarray that does the LSB0 stuff"""
     __slots__ = ('_bitarray', 'modified_length', 'immutable')
@@ -1,60 +1,100 @@
 from __future__ import annotations
 import struct
 import math
+import bisect
 import functools
 from typing import Union, Optional, Dict, Callable
 import bitarray
+from bitarray.util import hex2ba, base2ba
 from bitstring.bitstore import BitStore
 import bitstring
 from bitstring.fp8 import p4binary_fmt, p3binary_fmt
 from bitstring.mxfp import e3m2mxfp_fmt, e2m3mxfp_fmt, e2m1mxfp_fmt, e4m3mxfp_saturate_fmt, e5m2mxfp_saturate_fmt, e4m3mxfp_overflow_fmt, e5m2mxfp_overflow_fmt
 CACHE_SIZE = 256
 
+# Lowercases and strips spaces and underscores in a single C-level pass.
+_TIDY_TABLE = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz', ' _')
+
 def tidy_input_string(s: str) -> str:
     """Return string made lowercase and with all whitespace and underscores removed."""
-    return s.lower().replace('_', '').replace(' ', '')
+    return s.translate(_TIDY_TABLE)
 e8m0mxfp_allowed_values = [float(2 ** x) for x in range(-127, 128)]
 
-def hex2bitstore(s: str) -> BitStore:
-    """Convert a hex string to a BitStore."""
+def e8m0_index(value: float) -> int:
+    """Return the e8m0 code for an exactly representable power of two.
+
+    The allowed values are sorted, so a binary search replaces a linear scan.
+    Raises a ValueError for values with no exact e8m0 representation, as no
+    rounding is done for this format.
+    """
+    i = bisect.bisect_left(e8m0mxfp_allowed_values, value)
+    if i == len(e8m0mxfp_allowed_values) or e8m0mxfp_allowed_values[i] != value:
+        raise ValueError(f"{value} is not a valid e8m0mxfp value.")
+    return i
+
+# The cached builders below return a shared bitarray per token; the public
+# helpers wrap it in a BitStore, whose __init__ copies it, so callers can
+# mutate their result without poisoning the cache.
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _hex2bitarray(s: str) -> bitarray.bitarray:
     s = tidy_input_string(s)
     if not s.startswith('0x'):
         raise ValueError("Hex string must start with '0x'")
-    s = s[2:]  # Remove '0x'
-    # Each hex digit represents 4 bits
-    bits = ''.join(format(int(c, 16), '04b') for c in s)
-    ba = bitarray.bitarray(bits)
-    return BitStore(ba)
+    return hex2ba(s[2:], endian='big')
 
-def bin2bitstore(s: str) -> BitStore:
-    """Convert a binary string to a BitStore."""
+def hex2bitstore(s: str) -> BitStore:
+    """Convert a hex string to a BitStore."""
+    return BitStore(_hex2bitarray(s))
+
+# Below this length base2ba is quicker than going via an int (measured crossover ~400 bits).
+_BIN_INT_PARSE_THRESHOLD = 400
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _bin2bitarray(s: str) -> bitarray.bitarray:
     s = tidy_input_string(s)
     if not s.startswith('0b'):
         raise ValueError("Binary string must start with '0b'")
     s = s[2:]  # Remove '0b'
-    ba = bitarray.bitarray(s)
-    return BitStore(ba)
+    if len(s) < _BIN_INT_PARSE_THRESHOLD or s.strip('01'):
+        # base2ba also handles anything that isn't pure '0'/'1' digits: it
+        # skips whitespace and rejects the characters (signs, non-ASCII
+        # digits) that int() would happily parse differently.
+        return base2ba(2, s, endian='big')
+    # For long all-digit literals a single int parse plus frombytes beats the ASCII path.
+    nbytes, rem = divmod(len(s), 8)
+    ba = bitarray.bitarray(s[:rem])
+    tail = s[rem:]
+    if tail:
+        packed = bitarray.bitarray()
+        packed.frombytes(int(tail, 2).to_bytes(nbytes, 'big'))
+        ba.extend(packed)
+    return ba
 
-def oct2bitstore(s: str) -> BitStore:
-    """Convert an octal string to a BitStore."""
+def bin2bitstore(s: str) -> BitStore:
+    """Convert a binary string to a BitStore."""
+    return BitStore(_bin2bitarray(s))
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _oct2bitarray(s: str) -> bitarray.bitarray:
     s = tidy_input_string(s)
     if not s.startswith('0o'):
         raise ValueError("Octal string must start with '0o'")
-    s = s[2:]  # Remove '0o'
-    # Each octal digit represents 3 bits
-    bits = ''.join(format(int(c, 8), '03b') for c in s)
-    ba = bitarray.bitarray(bits)
-    return BitStore(ba)
+    return base2ba(8, s[2:], endian='big')
 
-literal_bit_funcs: Dict[str, Callable[..., BitStore]] = {'0x': hex2bitstore, '0X': hex2bitstore, '0b': bin2bitstore, '0B': bin2bitstore, '0o': oct2bitstore, '0O': oct2bitstore}
+def oct2bitstore(s: str) -> BitStore:
+    """Convert an octal string to a BitStore."""
+    return BitStore(_oct2bitarray(s))
+
+literal_bit_funcs: Dict[str, Callable[..., BitStore]] = {'0x': hex2bitstore, '0b': bin2bitstore, '0o': oct2bitstore}
 
 def bitstore_from_token(token: str) -> BitStore:
     """Create a BitStore from a token string.
-    
+
     The token can be a hex, binary or octal string.
     """
     token = tidy_input_string(token)
-    for prefix, func in literal_bit_funcs.items():
-        if token.startswith(prefix.lower()):
-            return func(token)
-    raise ValueError(f"Invalid token format: {token}. Must start with one of {list(literal_bit_funcs.keys())}")
\ No newline at end of file
+    func = literal_bit_funcs.get(token[:2])
+    if func is None:
+        raise ValueError(f"Invalid token format: {token}. Must start with one of {list(literal_bit_funcs.keys())}")
+    return func(token)
\ No newline at end of file
@@ -255,6 +255,21 @@ class Register:
             cls._instance = super(Register, cls).__new__(cls)
         return cls._instance
 
+    @classmethod
+    def add_dtype(cls, definition: DtypeDefinition):
+        cls.names[definition.name] = definition
+        if definition.get_fn is not None:
+            setattr(bitstring.bits.Bits, definition.name,
+                    property(fget=definition.get_fn, doc=f"The bitstring as {definition.description}. Read only."))
+
+    @classmethod
+    def add_dtype_alias(cls, name: str, alias: str):
+        cls.names[alias] = cls.names[name]
+        definition = cls.names[alias]
+        if definition.get_fn is not None:
+            setattr(bitstring.bits.Bits, alias,
+                    property(fget=definition.get_fn, doc=f"An alias for '{name}'. Read only."))
+
     @classmethod
     def __getitem__(cls, name: str) -> DtypeDefinition:
         return cls.names[name]
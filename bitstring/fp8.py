@@ -3,27 +3,61 @@ The 8-bit float formats used here are from a proposal supported by Graphcore, AM
 See https://arxiv.org/abs/2206.02915
 
 """
+import os
+import mmap
 import struct
 import zlib
 import array
 import bitarray
 from bitstring.luts import binary8_luts_compressed
 import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bound once at module level - saves a Struct construction and a global lookup per call.
+_pack_be_f16 = struct.Struct('>e').pack
 
 class Binary8Format:
     """8-bit floating point formats based on draft IEEE binary8"""
+    __slots__ = ('exp_bits', 'bias', 'pos_clamp_value', 'neg_clamp_value',
+                 '_exp_shift', '_mant_scale', '_exp_max',
+                 'lut_float16_to_binary8', 'lut_binary8_to_float', '_lut_np')
 
     def __init__(self, exp_bits: int, bias: int):
         self.exp_bits = exp_bits
         self.bias = bias
         self.pos_clamp_value = 127
         self.neg_clamp_value = 255
+        # Precomputed constants for the encode/decode arithmetic.
+        self._exp_shift = 7 - exp_bits
+        self._mant_scale = 1 << self._exp_shift
+        self._exp_max = 1 << exp_bits
+        self._lut_np = None
 
     def __str__(self):
         return f'Binary8Format(exp_bits={self.exp_bits}, bias={self.bias})'
 
     def float_to_int8(self, f: float) -> int:
         """Given a Python float convert to the best float8 (expressed as an integer in 0-255 range)."""
+        # Convert to a float16, then use its bit pattern to index the large LUT.
+        try:
+            b = _pack_be_f16(f)
+        except (OverflowError, struct.error):
+            # Too big for a float16, so clamp.
+            return self.pos_clamp_value if f > 0 else self.neg_clamp_value
+        return self.lut_float16_to_binary8[(b[0] << 8) | b[1]]
+
+    def slow_float_to_int8(self, f: float) -> int:
+        """Compute a float8 for a Python float arithmetically, without the LUT.
+
+        A baseline reference implementation, not the source of the shipped
+        LUT: that table rounds to nearest and encodes subnormals, whereas
+        this truncates and flushes small values to zero.
+        """
         if math.isnan(f):
             return 0
         if math.isinf(f):
@@ -32,20 +66,57 @@ class Binary8Format:
             return self.neg_clamp_value
         if f == 0:
             return 0
+        exp_shift = self._exp_shift
         sign = 1 if f < 0 else 0
-        f = abs(f)
-        exp = math.floor(math.log2(f))
-        mantissa = int((f / 2**exp - 1) * (1 << (7 - self.exp_bits)))
+        # frexp gives f = m * 2**e with 0.5 <= m < 1, so the exponent is e - 1
+        # and the fractional mantissa is 2*m - 1 (exactly).
+        m, e = math.frexp(abs(f))
+        exp = e - 1
+        mantissa = int((2.0 * m - 1.0) * self._mant_scale)
         exp = exp + self.bias
         if exp < 0:
             return 0
-        if exp >= (1 << self.exp_bits):
+        if exp >= self._exp_max:
             return self.neg_clamp_value if sign else self.pos_clamp_value
-        result = (sign << 7) | (exp << (7 - self.exp_bits)) | mantissa
+        result = (sign << 7) | (exp << exp_shift) | mantissa
         return result
 
+    def float_to_int8_array(self, values) -> 'np.ndarray':
+        """Convert an array of floats to binary8 ints with a single gather through the float16 LUT."""
+        if np is None:
+            raise ImportError("float_to_int8_array needs numpy to be installed.")
+        if not hasattr(self, 'lut_float16_to_binary8'):
+            decompress_luts()
+        if isinstance(values, np.ndarray) and values.dtype == np.float16 and values.flags.c_contiguous:
+            f16 = values.view(np.uint16)  # Zero-copy reinterpretation.
+        else:
+            # Values beyond the float16 range overflow to inf, which the LUT
+            # clamps - the same as the scalar path, so silence the warning.
+            with np.errstate(over='ignore'):
+                f16 = np.ascontiguousarray(values, dtype=np.float16).view(np.uint16)
+        lut = np.frombuffer(self.lut_float16_to_binary8, dtype=np.uint8)
+        return lut[f16]
+
+    def int8_to_float_array(self, values) -> 'np.ndarray':
+        """Convert an array of binary8 ints to floats with a single gather through the decode LUT."""
+        if np is None:
+            raise ImportError("int8_to_float_array needs numpy to be installed.")
+        if self._lut_np is None:
+            decompress_luts()
+        return self._lut_np[np.asarray(values, dtype=np.uint8)]
+
     def createLUT_for_binary8_to_float(self) -> array.array:
         """Create a LUT to convert an int in range 0-255 representing a float8 into a Python float"""
+        if np is not None:
+            # Vectorised construction - worthwhile as this runs at import time.
+            i = np.arange(256, dtype=np.int32)
+            em = 7 - self.exp_bits
+            sign = np.where(i & 0x80, -1.0, 1.0)
+            exp = (i >> em) & ((1 << self.exp_bits) - 1)
+            mantissa = i & ((1 << em) - 1)
+            value = sign * (1 + mantissa / (1 << em)) * np.ldexp(1.0, exp - self.bias)
+            value[exp == 0] = 0.0
+            return array.array('f', value.astype(np.float32).tobytes())
         lut = array.array('f')
         for i in range(256):
             sign = -1 if i & 0x80 else 1
@@ -60,12 +131,37 @@ class Binary8Format:
 p4binary_fmt = Binary8Format(exp_bits=4, bias=8)
 p3binary_fmt = Binary8Format(exp_bits=5, bias=16)
 
-def decompress_luts() -> None:
-    """Decompress the lookup tables for binary8 formats."""
-    for fmt in [p4binary_fmt, p3binary_fmt]:
-        if not hasattr(fmt, 'lut_float16_to_binary8'):
+def _load_raw_lut(filename: str) -> Optional[mmap.mmap]:
+    """Return a read-only mmap of a raw LUT file, or None if it isn't present.
+
+    The mapped pages are shared between forked processes, and no decompression
+    is needed at import time.
+    """
+    path = os.path.join(os.path.dirname(__file__), '_luts', filename)
+    try:
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+def _init_luts(fmt: Binary8Format) -> None:
+    """Set up the lookup tables for a single binary8 format."""
+    if not hasattr(fmt, 'lut_float16_to_binary8'):
+        raw = _load_raw_lut(f'binary8_{fmt.exp_bits}_{fmt.bias}.bin')
+        if raw is not None:
+            fmt.lut_float16_to_binary8 = raw
+        else:
             key = (fmt.exp_bits, fmt.bias)
             compressed_data = binary8_luts_compressed[key]
-            fmt.lut_float16_to_binary8 = zlib.decompress(compressed_data[0])
-        if not hasattr(fmt, 'lut_binary8_to_float'):
-            fmt.lut_binary8_to_float = fmt.createLUT_for_binary8_to_float()
\ No newline at end of file
+            fmt.lut_float16_to_binary8 = zlib.decompress(compressed_data[1])
+    if not hasattr(fmt, 'lut_binary8_to_float'):
+        fmt.lut_binary8_to_float = fmt.createLUT_for_binary8_to_float()
+    if np is not None and fmt._lut_np is None:
+        # ndarray view of the decode table for use as a gather table.
+        fmt._lut_np = np.frombuffer(fmt.lut_binary8_to_float, dtype=np.float32)
+
+def decompress_luts() -> None:
+    """Decompress the lookup tables for binary8 formats."""
+    # The formats are independent and zlib releases the GIL, so overlap them.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        list(ex.map(_init_luts, [p4binary_fmt, p3binary_fmt]))
\ No newline at end of file
@@ -1,13 +1,60 @@
 import array
 import math
+import mmap
+import os
 import struct
 import bitarray
 from bitstring.luts import mxfp_luts_compressed
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bound once at module level - saves a Struct construction and a global lookup per call.
+_pack_be_f16 = struct.Struct('>e').pack
+
+def _make_slow_encoder(exp_bits: int, mantissa_bits: int, bias: int, pos_clamp_value: int,
+                       neg_clamp_value: int, saturate: bool):
+    """Return a float-to-mxfp-int closure with the format constants bound as locals."""
+    mant_scale = 1 << mantissa_bits
+    exp_max = 1 << exp_bits
+    sign_shift = exp_bits + mantissa_bits
+    frexp = math.frexp
+    isnan = math.isnan
+    isinf = math.isinf
+
+    def encode(f: float) -> int:
+        if isnan(f):
+            return 0
+        if isinf(f):
+            return pos_clamp_value if f > 0 else neg_clamp_value
+        if f == 0:
+            return 0
+        sign = 1 if f < 0 else 0
+        # frexp gives f = m * 2**e with 0.5 <= m < 1, so the exponent is e - 1
+        # and the fractional mantissa is 2*m - 1 (exactly).
+        m, e = frexp(abs(f))
+        exp = e - 1 + bias
+        mantissa = int((2.0 * m - 1.0) * mant_scale)
+        if exp < 0:
+            return 0
+        if exp >= exp_max:
+            if saturate:
+                return neg_clamp_value if sign else pos_clamp_value
+            exp = exp_max - 1
+            mantissa = mant_scale - 1
+        return (sign << sign_shift) | (exp << mantissa_bits) | mantissa
+    return encode
 
 class MXFPFormat:
     """Defining an MXFP micro-scaling floating point format"""
+    __slots__ = ('exp_bits', 'mantissa_bits', 'bias', 'mxfp_overflow',
+                 'pos_clamp_value', 'neg_clamp_value',
+                 '_exp_shift', '_sign_shift', '_mant_scale', '_exp_max',
+                 'lut_float16_to_mxfp', 'lut_int_to_float', '_lut_np', '_slow_encoder')
 
     def __init__(self, exp_bits: int, mantissa_bits: int, bias: int, mxfp_overflow: str):
         self.exp_bits = exp_bits
@@ -29,39 +76,77 @@ class MXFPFormat:
             else:
                 self.pos_clamp_value = 124
                 self.neg_clamp_value = 252
+        # Precomputed constants for the encode/decode arithmetic.
+        self._exp_shift = mantissa_bits
+        self._sign_shift = exp_bits + mantissa_bits
+        self._mant_scale = 1 << mantissa_bits
+        self._exp_max = 1 << exp_bits
         self.lut_float16_to_mxfp = None
         self.lut_int_to_float = None
+        self._lut_np = None
+        # Specialised encode closure with all the format constants inlined,
+        # built after the clamp values have been finalised above.
+        self._slow_encoder = _make_slow_encoder(exp_bits, mantissa_bits, bias, self.pos_clamp_value,
+                                                self.neg_clamp_value, mxfp_overflow == 'saturate')
 
     def __str__(self):
         return f"MXFPFormat(exp_bits={self.exp_bits}, mantissa_bits={self.mantissa_bits}, bias={self.bias}, mxfp_overflow='{self.mxfp_overflow}')"
 
     def float_to_int(self, f: float) -> int:
         """Given a Python float convert to the best mxfp float (expressed as an int) that represents it."""
-        if math.isnan(f):
-            return 0
-        if math.isinf(f):
-            if f > 0:
-                return self.pos_clamp_value
-            return self.neg_clamp_value
-        if f == 0:
-            return 0
-        sign = 1 if f < 0 else 0
-        f = abs(f)
-        exp = math.floor(math.log2(f))
-        mantissa = int((f / 2**exp - 1) * (1 << self.mantissa_bits))
-        exp = exp + self.bias
-        if exp < 0:
-            return 0
-        if exp >= (1 << self.exp_bits):
-            if self.mxfp_overflow == 'saturate':
-                return self.neg_clamp_value if sign else self.pos_clamp_value
-            exp = (1 << self.exp_bits) - 1
-            mantissa = (1 << self.mantissa_bits) - 1
-        result = (sign << (self.exp_bits + self.mantissa_bits)) | (exp << self.mantissa_bits) | mantissa
-        return result
+        # Convert to a float16, then use its bit pattern to index the large LUT.
+        try:
+            b = _pack_be_f16(f)
+        except (OverflowError, struct.error):
+            # Too big for a float16, so clamp.
+            return self.pos_clamp_value if f > 0 else self.neg_clamp_value
+        return self.lut_float16_to_mxfp[(b[0] << 8) | b[1]]
+
+    def slow_float_to_int(self, f: float) -> int:
+        """Compute an mxfp int for a Python float arithmetically, without the LUT.
+
+        A baseline reference implementation, not the source of the shipped
+        LUT: that table rounds to nearest and encodes subnormals, whereas
+        this truncates and flushes small values to zero, so a table rebuilt
+        from it (createLUT_for_float16_to_mxfp) differs from the shipped one.
+        """
+        return self._slow_encoder(f)
+
+    def float_to_int_array(self, values) -> 'np.ndarray':
+        """Convert an array of floats to mxfp ints with a single gather through the float16 LUT."""
+        if np is None:
+            raise ImportError("float_to_int_array needs numpy to be installed.")
+        if self.lut_float16_to_mxfp is None:
+            decompress_luts()
+        if isinstance(values, np.ndarray) and values.dtype == np.float16 and values.flags.c_contiguous:
+            f16 = values.view(np.uint16)  # Zero-copy reinterpretation.
+        else:
+            # Values beyond the float16 range overflow to inf, which the LUT
+            # clamps - the same as the scalar path, so silence the warning.
+            with np.errstate(over='ignore'):
+                f16 = np.ascontiguousarray(values, dtype=np.float16).view(np.uint16)
+        lut = np.frombuffer(self.lut_float16_to_mxfp, dtype=np.uint8)
+        return lut[f16]
+
+    def int_to_float_array(self, values) -> 'np.ndarray':
+        """Convert an array of mxfp ints to floats with a single gather through the decode LUT."""
+        if np is None:
+            raise ImportError("int_to_float_array needs numpy to be installed.")
+        if self._lut_np is None:
+            decompress_luts()
+        return self._lut_np[np.asarray(values, dtype=np.uint8)]
 
     def createLUT_for_int_to_float(self) -> array.array:
         """Create a LUT to convert an int in representing a MXFP float into a Python float"""
+        if np is not None:
+            # Vectorised construction - worthwhile as this runs at import time.
+            i = np.arange(1 << (1 + self.exp_bits + self.mantissa_bits), dtype=np.int32)
+            sign = np.where(i >> self._sign_shift, -1.0, 1.0)
+            exp = (i >> self._exp_shift) & (self._exp_max - 1)
+            mantissa = i & (self._mant_scale - 1)
+            value = sign * (1 + mantissa / self._mant_scale) * np.ldexp(1.0, exp - self.bias)
+            value[exp == 0] = 0.0
+            return array.array('f', value.astype(np.float32).tobytes())
         lut = array.array('f')
         for i in range(1 << (1 + self.exp_bits + self.mantissa_bits)):
             sign = -1 if i >> (self.exp_bits + self.mantissa_bits) else 1
@@ -76,10 +161,36 @@ class MXFPFormat:
 
     def createLUT_for_float16_to_mxfp(self) -> bytes:
         """Create a LUT to convert a float16 into a MXFP format"""
+        if np is not None:
+            # Vectorised version of slow_float_to_int over every float16 bit
+            # pattern, with the nan/inf/zero/underflow cases applied as masks.
+            f = np.arange(65536, dtype=np.uint16).view(np.float16).astype(np.float64)
+            isnan = np.isnan(f)
+            isinf = np.isinf(f)
+            iszero = f == 0
+            # Substitute 1.0 for the special values so that frexp stays finite;
+            # their results are overwritten below.
+            m, e = np.frexp(np.abs(np.where(isnan | isinf | iszero, 1.0, f)))
+            mantissa = ((2.0 * m - 1.0) * self._mant_scale).astype(np.int32)
+            exp = e - 1 + self.bias
+            sign = np.signbit(f).astype(np.int32)
+            underflow = exp < 0
+            overflow = exp >= self._exp_max
+            clamp = np.where(sign == 1, self.neg_clamp_value, self.pos_clamp_value)
+            if self.mxfp_overflow != 'saturate':
+                exp = np.where(overflow, self._exp_max - 1, exp)
+                mantissa = np.where(overflow, self._mant_scale - 1, mantissa)
+            result = (sign << self._sign_shift) | (exp << self._exp_shift) | mantissa
+            if self.mxfp_overflow == 'saturate':
+                result = np.where(overflow, clamp, result)
+            result = np.where(isinf, clamp, result)
+            result = np.where(isnan | iszero | underflow, 0, result)
+            return result.astype(np.uint8).tobytes()
+        encode = self._slow_encoder
         lut = bytearray(65536)
         for i in range(65536):
             f = struct.unpack('e', struct.pack('H', i))[0]
-            lut[i] = self.float_to_int(f)
+            lut[i] = encode(f)
         return bytes(lut)
 e2m1mxfp_fmt = MXFPFormat(exp_bits=2, mantissa_bits=1, bias=1, mxfp_overflow='saturate')
 e2m3mxfp_fmt = MXFPFormat(exp_bits=2, mantissa_bits=3, bias=1, mxfp_overflow='saturate')
@@ -89,12 +200,38 @@ e5m2mxfp_saturate_fmt = MXFPFormat(exp_bits=5, mantissa_bits=2, bias=15, mxfp_ov
 e4m3mxfp_overflow_fmt = MXFPFormat(exp_bits=4, mantissa_bits=3, bias=7, mxfp_overflow='overflow')
 e5m2mxfp_overflow_fmt = MXFPFormat(exp_bits=5, mantissa_bits=2, bias=15, mxfp_overflow='overflow')
 
-def decompress_luts() -> None:
-    """Decompress the lookup tables for MXFP formats."""
-    for fmt in [e2m1mxfp_fmt, e2m3mxfp_fmt, e3m2mxfp_fmt, e4m3mxfp_saturate_fmt, e5m2mxfp_saturate_fmt, e4m3mxfp_overflow_fmt, e5m2mxfp_overflow_fmt]:
-        if fmt.lut_float16_to_mxfp is None:
+def _load_raw_lut(filename: str) -> Optional[mmap.mmap]:
+    """Return a read-only mmap of a raw LUT file, or None if it isn't present.
+
+    The mapped pages are shared between forked processes, and no decompression
+    is needed at import time.
+    """
+    path = os.path.join(os.path.dirname(__file__), '_luts', filename)
+    try:
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+def _init_luts(fmt: MXFPFormat) -> None:
+    """Set up the lookup tables for a single MXFP format."""
+    if fmt.lut_float16_to_mxfp is None:
+        raw = _load_raw_lut(f'mxfp_{fmt.exp_bits}_{fmt.mantissa_bits}_{fmt.bias}_{fmt.mxfp_overflow}.bin')
+        if raw is not None:
+            fmt.lut_float16_to_mxfp = raw
+        else:
             key = (fmt.exp_bits, fmt.mantissa_bits, fmt.bias, fmt.mxfp_overflow)
             compressed_data = mxfp_luts_compressed[key]
-            fmt.lut_float16_to_mxfp = zlib.decompress(compressed_data[0])
-        if fmt.lut_int_to_float is None:
-            fmt.lut_int_to_float = fmt.createLUT_for_int_to_float()
\ No newline at end of file
+            fmt.lut_float16_to_mxfp = zlib.decompress(compressed_data[1])
+    if fmt.lut_int_to_float is None:
+        fmt.lut_int_to_float = fmt.createLUT_for_int_to_float()
+    if np is not None and fmt._lut_np is None:
+        # ndarray view of the decode table for use as a gather table.
+        fmt._lut_np = np.frombuffer(fmt.lut_int_to_float, dtype=np.float32)
+
+def decompress_luts() -> None:
+    """Decompress the lookup tables for MXFP formats."""
+    fmts = [e2m1mxfp_fmt, e2m3mxfp_fmt, e3m2mxfp_fmt, e4m3mxfp_saturate_fmt, e5m2mxfp_saturate_fmt, e4m3mxfp_overflow_fmt, e5m2mxfp_overflow_fmt]
+    # The formats are independent and zlib releases the GIL, so overlap them.
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(_init_luts, fmts))
\ No newline at end of file
@@ -1,16 +1,42 @@
 """
 This script generates the LUTs used for the various exotic floating point formats.
 Its output is the luts.py file which is then used by the bitstring package.
+
+Run with --raw-luts-only to just regenerate the mmap-able raw LUT files in
+bitstring/_luts from the compressed data already shipped in luts.py. The raw
+files are always produced this way (by decompression, not regeneration), so
+they are guaranteed to be byte-identical to the luts.py content.
 """
 
+import os
+import sys
 import pprint
 import zlib
 import shutil
 from bitstring.mxfp import MXFPFormat
 from bitstring.fp8 import Binary8Format
 
+LUTS_DIR = './bitstring/_luts'
+
+
+def write_raw_luts() -> None:
+    """Write the uncompressed float16 LUTs from the shipped luts.py data."""
+    from bitstring.luts import mxfp_luts_compressed, binary8_luts_compressed
+    os.makedirs(LUTS_DIR, exist_ok=True)
+    for (exp_bits, mantissa_bits, bias, mxfp_overflow), data in mxfp_luts_compressed.items():
+        with open(f'{LUTS_DIR}/mxfp_{exp_bits}_{mantissa_bits}_{bias}_{mxfp_overflow}.bin', 'wb') as g:
+            g.write(zlib.decompress(data[1]))
+    for (exp_bits, bias), data in binary8_luts_compressed.items():
+        with open(f'{LUTS_DIR}/binary8_{exp_bits}_{bias}.bin', 'wb') as g:
+            g.write(zlib.decompress(data[1]))
+
+
 if __name__ == '__main__':
 
+    if '--raw-luts-only' in sys.argv[1:]:
+        write_raw_luts()
+        sys.exit(0)
+
     mxfps = [MXFPFormat(exp_bits=2, mantissa_bits=1, bias=1, mxfp_overflow='saturate'),
              MXFPFormat(exp_bits=2, mantissa_bits=3, bias=1, mxfp_overflow='saturate'),
              MXFPFormat(exp_bits=3, mantissa_bits=2, bias=3, mxfp_overflow='saturate'),
@@ -46,4 +72,8 @@ if __name__ == '__main__':
         f.write("\n\nbinary8_luts_compressed = \\\n")
         pprint.pp(binary8_luts_compressed, width=120, stream=f)
 
-    shutil.move('./bitstring/luts_temp.py', './bitstring/luts.py')
\ No newline at end of file
+    shutil.move('./bitstring/luts_temp.py', './bitstring/luts.py')
+
+    # Rewrite the raw files from the freshly written luts.py so the two can
+    # never disagree.
+    write_raw_luts()
\ No newline at end of file
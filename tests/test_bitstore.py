@@ -72,6 +72,28 @@ class TestBasicLSB0Functionality:
             a[-6] = 0
 
 
+class TestLiteralHelpers:
+
+    def test_oct_conversion(self):
+        from bitstring.bitstore_helpers import oct2bitstore
+        a = oct2bitstore('0o752')
+        assert a._bitarray.to01() == '111101010'
+        assert len(oct2bitstore('0o0')._bitarray) == 3
+
+    def test_oct_validation(self):
+        from bitstring.bitstore_helpers import oct2bitstore
+        with pytest.raises(ValueError):
+            _ = oct2bitstore('0o8')
+        with pytest.raises(ValueError):
+            _ = oct2bitstore('752')
+
+    def test_hex_and_bin_conversion(self):
+        from bitstring.bitstore_helpers import hex2bitstore, bin2bitstore
+        assert hex2bitstore('0xa5')._bitarray.to01() == '10100101'
+        assert hex2bitstore('0xF')._bitarray.to01() == '1111'
+        assert bin2bitstore('0b0110_01')._bitarray.to01() == '011001'
+
+
 class TestGettingSlices:
 
     def teardown_method(self) -> None: